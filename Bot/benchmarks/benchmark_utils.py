@@ -0,0 +1,65 @@
+"""
+Shared helpers for the benchmark scripts: synthetic candles, stored documents and timing.
+
+Importing this module also puts the Bot directory on sys.path, so the scripts can be
+run as `python benchmarks/<script>.py` from the Bot directory.
+"""
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from processors import DataProcessor, DataFormatter
+
+
+def synthetic_candles(count, start='2020-01-01', seed=42):
+    """
+    Random walk 4h candles with naive UTC timestamps
+
+    Args:
+        count (int): Number of candles
+        start (str): Open time of the first candle
+        seed (int): Random seed
+
+    Returns:
+        pd.DataFrame: timestamp, open, high, low, close and volume columns
+    """
+    rng = np.random.default_rng(seed)
+    close = 10000 * np.exp(np.cumsum(rng.normal(0, 0.012, count)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.006, count)) * close
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start, periods=count, freq='4h'),
+        'open': open_.round(2),
+        'high': (np.maximum(open_, close) + spread).round(2),
+        'low': (np.minimum(open_, close) - spread).round(2),
+        'close': close.round(2),
+        'volume': rng.uniform(100, 5000, count).round(3),
+    })
+
+
+def seed_documents(candles):
+    """
+    Calculate the indicators for candles and convert them to stored (flat layout) documents
+    """
+    df = candles.copy()
+    df['timestamp'] = df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
+    df = DataProcessor.basic_indicators(df)
+    df = DataProcessor.calculate_dema(df)
+    df = DataProcessor.add_supertrend(df)
+    df = DataProcessor.add_FBB(df)
+    return DataFormatter.convert_to_mongo_format(df)
+
+
+def timed(func, repeat=1):
+    """
+    Returns:
+        tuple: Mean seconds per call and the result of the last call
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
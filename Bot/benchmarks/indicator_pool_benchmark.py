@@ -0,0 +1,61 @@
+"""
+Measures how indicator calculation scales with symbols and worker processes.
+
+Run from the Bot directory:
+    python benchmarks/indicator_pool_benchmark.py --symbols 16 --window 450 --workers 1 2 4 8
+
+Compares the sequential DataProcessor path with ParallelIndicatorProcessor for each
+worker count. Timings are taken after a warm-up run so worker start-up isn't counted.
+"""
+import argparse
+import pandas as pd
+from benchmark_utils import synthetic_candles, timed
+
+from processors.data_processor import DataProcessor
+from processors.parallel_processor import ParallelIndicatorProcessor
+
+
+def synthetic_frames(symbols, window):
+    frames = {}
+    for i in range(symbols):
+        df = synthetic_candles(window, seed=i)
+        last_timestamp = df['timestamp'].iloc[-7].to_pydatetime()
+        df['timestamp'] = df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
+        frames[f"SYM{i}"] = (df, last_timestamp)
+    return frames
+
+
+def run_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark the indicator process pool")
+    parser.add_argument('--symbols', type=int, default=16, help="Number of symbols per run")
+    parser.add_argument('--window', type=int, default=450, help="Candles per symbol")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help="Worker counts to test")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs averaged per measurement")
+    args = parser.parse_args()
+
+    frames = synthetic_frames(args.symbols, args.window)
+
+    def sequential():
+        for df, last_timestamp in frames.values():
+            DataProcessor.calculate_indicators(df, last_timestamp)
+
+    baseline, _ = timed(sequential, args.repeat)
+    results = [{'backend': 'sequential', 'run (s)': round(baseline, 3), 'speedup': 1.0}]
+
+    for workers in args.workers:
+        processor = ParallelIndicatorProcessor(workers)
+        processor.calculate_indicators(frames)  # Warm up the workers
+        seconds, _ = timed(lambda: processor.calculate_indicators(frames), args.repeat)
+        processor.close()
+        results.append({
+            'backend': f"pool x{workers}",
+            'run (s)': round(seconds, 3),
+            'speedup': round(baseline / seconds, 2),
+        })
+
+    print(f"{args.symbols} symbols x {args.window} candles")
+    print(pd.DataFrame(results).set_index('backend').to_string())
+
+
+if __name__ == "__main__":
+    run_benchmark()
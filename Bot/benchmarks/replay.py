@@ -0,0 +1,253 @@
+"""
+Replays recorded or synthetic 4h candles through the full analysis pipeline to measure
+candle-close-to-alert latency and throughput.
+
+Run from the Bot directory:
+    python benchmarks/replay.py --candles 3000 --latency 0.3 --rate-limit 0.05 --gap-rate 0.01
+    python benchmarks/replay.py --csv btc_4h.csv --run-every 24 --backlog 30
+
+Each scheduled run calls main() exactly as the bot does, with a fake ccxt-compatible
+exchange in place of Bybit, an in-memory store in place of MongoDB and a stub Telegram
+bot that records when each alert was sent. Time runs on an accelerated clock: the pipeline's
+own compute time passes at 1x, while waits (exchange latency, retry backoff, the gap between
+runs) are skipped in real time but still counted in simulated time.
+"""
+import re
+import time
+import argparse
+import tempfile
+import datetime
+import numpy as np
+import pandas as pd
+import ccxt
+
+from benchmark_utils import synthetic_candles, seed_documents
+
+import main as pipeline
+from handlers import CustomLoggerHandler
+from processors import TimeframeResampler
+
+CANDLE_PERIOD = pd.Timedelta(hours=4)
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+ALERT_TIMESTAMP = re.compile(r"timestamp: (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})")
+
+
+class ReplayClock:
+    """
+    Simulated UTC clock. Real elapsed time passes at 1x, sleep() advances simulated
+    time by the full duration while only sleeping duration / speed in real time.
+    """
+    def __init__(self, start, speed=3600.0):
+        self.speed = speed
+        self._base = start
+        self._anchor = time.perf_counter()
+
+    def now(self):
+        return self._base + datetime.timedelta(seconds=time.perf_counter() - self._anchor)
+
+    def sleep(self, seconds):
+        real_seconds = seconds / self.speed
+        time.sleep(real_seconds)
+        self._base += datetime.timedelta(seconds=seconds - real_seconds)
+
+    def advance_to(self, moment):
+        if moment > self.now():
+            self._base = moment
+            self._anchor = time.perf_counter()
+
+
+class FakeExchange:
+    """
+    ccxt-compatible exchange serving candles that have opened by the clock's current
+    time, with configurable response latency, 429 rate limit errors and missing candles.
+    """
+    def __init__(self, candles, clock, latency=0.2, rate_limit_rate=0.0, gap_rate=0.0, seed=42):
+        self.clock = clock
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.rng = np.random.default_rng(seed)
+
+        self._timestamps = (pd.to_datetime(candles['timestamp'], utc=True).astype('int64') // 10**6).to_numpy()
+        self._ohlcv = candles[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=float)
+        self._missing = self.rng.random(len(candles)) < gap_rate
+
+        self.calls = 0
+        self.rate_limited = 0
+
+    def fetch_ohlcv(self, symbol, timeframe='4h', since=None, limit=None):
+        self.calls += 1
+        self.clock.sleep(self.latency * self.rng.uniform(0.5, 1.5))
+
+        if self.rng.random() < self.rate_limit_rate:
+            self.rate_limited += 1
+            raise ccxt.RateLimitExceeded('fake exchange 429 Too Many Requests')
+
+        now_ms = int(self.clock.now().timestamp() * 1000)
+        mask = (self._timestamps <= now_ms) & ~self._missing
+        if since is not None:
+            mask &= self._timestamps >= since
+
+        indices = np.flatnonzero(mask)[:limit]
+        return [[int(self._timestamps[i])] + self._ohlcv[i].tolist() for i in indices]
+
+
+class StubBot:
+    """Stands in for telebot.TeleBot and records when each message was sent"""
+    def __init__(self, clock):
+        self.clock = clock
+        self.sent = []
+
+    def send_message(self, chat_id, text, **kwargs):
+        self.sent.append((self.clock.now(), text))
+
+
+class ReplayStore:
+    """In-memory stand-in for MongoDBHandler holding documents in the flat layout"""
+    def __init__(self, documents):
+        self.documents = list(documents)
+
+    def get_last_processed_timestamp(self):
+        return self.documents[-1]['timestamp'] if self.documents else None
+
+    def fetch_last_450_rows(self):
+        return pd.DataFrame(self.documents[-450:])
+
+    def fetch_ohlcv_history(self, limit):
+        return pd.DataFrame(self.documents[-limit:])[OHLCV_COLUMNS]
+
+    def update_collection(self, mongo_data):
+        self.documents.extend(mongo_data)
+
+
+def load_candles(path):
+    """Load recorded candles from a CSV with timestamp (ms or datetime) and OHLCV columns"""
+    df = pd.read_csv(path)[OHLCV_COLUMNS]
+    if pd.api.types.is_numeric_dtype(df['timestamp']):
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    else:
+        df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True).dt.tz_localize(None)
+    return df.sort_values('timestamp').reset_index(drop=True)
+
+
+def run_replay(candles, history=1000, run_every=4, run_delay=1, backlog=0, latency=0.2,
+               rate_limit_rate=0.0, gap_rate=0.0, speed=3600.0, seed=42):
+    """
+    Replay the candles after the first `history` ones through scheduled runs of main()
+
+    Args:
+        candles (pd.DataFrame): 4h candles with naive UTC timestamps
+        history (int): Candles stored before the replay starts (at least 450)
+        run_every (int): Hours between scheduled runs
+        run_delay (int): Minutes after the candle close that each run starts
+        backlog (int): Candles that closed before the first run, simulating downtime
+        latency (float): Mean exchange response latency in seconds
+        rate_limit_rate (float): Probability of a 429 response per request
+        gap_rate (float): Probability that a candle is missing from the exchange
+        speed (float): Real-time speed up applied to waits
+        seed (int): Random seed for latency, 429s and gaps
+
+    Returns:
+        dict: Latency and throughput statistics
+    """
+    if history < 450:
+        raise ValueError("At least 450 candles of history are required")
+
+    # Start from a cold higher timeframe cache, as a fresh bot process would
+    pipeline.resampler = TimeframeResampler(pipeline.HIGHER_TIMEFRAMES)
+
+    store = ReplayStore(seed_documents(candles.iloc[:history]))
+    start = pd.Timestamp(candles['timestamp'].iloc[history - 1], tz='UTC') + CANDLE_PERIOD
+    end = pd.Timestamp(candles['timestamp'].iloc[-1], tz='UTC') + CANDLE_PERIOD
+
+    clock = ReplayClock(start.to_pydatetime(), speed=speed)
+    exchange = FakeExchange(candles, clock, latency, rate_limit_rate, gap_rate, seed)
+    bot = StubBot(clock)
+
+    log_dir = tempfile.mkdtemp(prefix='replay_')
+    logger = CustomLoggerHandler(base_dir=log_dir)
+    logger.bot = bot
+    logger.chat_id = 'replay'
+
+    interval = pd.Timedelta(hours=run_every)
+    run_at = (start + backlog * CANDLE_PERIOD).floor(interval) + interval + pd.Timedelta(minutes=run_delay)
+
+    runs, failed_runs, processed, wall_seconds = 0, 0, 0, 0.0
+    while run_at - pd.Timedelta(minutes=run_delay) <= end:
+        clock.advance_to(run_at.to_pydatetime())
+        stored_before = len(store.documents)
+
+        run_start = time.perf_counter()
+        try:
+            pipeline.main(mongo_handler=store, logger=logger, exchange=exchange, clock=clock)
+        except Exception as e:
+            failed_runs += 1
+            print(f"Replay run at {run_at} failed: {e}")
+        wall_seconds += time.perf_counter() - run_start
+
+        runs += 1
+        processed += len(store.documents) - stored_before
+        run_at += interval
+
+    latencies = []
+    seen = set()
+    errors = 0
+    for sent_at, text in bot.sent:
+        match = ALERT_TIMESTAMP.search(text)
+        if not match:
+            errors += 1
+            continue
+        # Alerts are repeated for the overlap candles of the next run, only time the first one
+        body = text.split('\n', 1)[-1]
+        if body in seen:
+            continue
+        seen.add(body)
+        candle_close = pd.Timestamp(match.group(1), tz='UTC')
+        latencies.append((pd.Timestamp(sent_at) - candle_close).total_seconds())
+
+    latencies = np.array(latencies)
+    percentiles = np.percentile(latencies, [50, 90, 99]) if len(latencies) else [np.nan] * 3
+    return {
+        'runs': runs,
+        'failed runs': failed_runs,
+        'candles processed': processed,
+        'candles/sec': round(processed / wall_seconds, 2) if wall_seconds else np.nan,
+        'mean run (s)': round(wall_seconds / runs, 3) if runs else np.nan,
+        'alerts': len(latencies),
+        'error messages': errors,
+        'latency p50 (s)': round(percentiles[0], 2),
+        'latency p90 (s)': round(percentiles[1], 2),
+        'latency p99 (s)': round(percentiles[2], 2),
+        'latency max (s)': round(latencies.max(), 2) if len(latencies) else np.nan,
+        'exchange requests': exchange.calls,
+        'exchange 429s': exchange.rate_limited,
+        'log dir': log_dir,
+    }
+
+
+def run_benchmark():
+    parser = argparse.ArgumentParser(description="Replay candles through the alert pipeline")
+    parser.add_argument('--csv', help="Recorded candles (timestamp, open, high, low, close, volume)")
+    parser.add_argument('--candles', type=int, default=2000, help="Synthetic candles when no CSV is given")
+    parser.add_argument('--history', type=int, default=1000, help="Candles stored before the replay")
+    parser.add_argument('--run-every', type=int, default=4, help="Hours between scheduled runs")
+    parser.add_argument('--run-delay', type=int, default=1, help="Minutes after candle close each run starts")
+    parser.add_argument('--backlog', type=int, default=0, help="Candles missed before the first run")
+    parser.add_argument('--latency', type=float, default=0.2, help="Mean exchange latency in seconds")
+    parser.add_argument('--rate-limit', type=float, default=0.0, help="Probability of a 429 per request")
+    parser.add_argument('--gap-rate', type=float, default=0.0, help="Probability a candle is missing")
+    parser.add_argument('--speed', type=float, default=3600.0, help="Real-time speed up for waits")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    candles = load_candles(args.csv) if args.csv else synthetic_candles(args.candles, seed=args.seed)
+    results = run_replay(
+        candles, history=args.history, run_every=args.run_every, run_delay=args.run_delay,
+        backlog=args.backlog, latency=args.latency, rate_limit_rate=args.rate_limit,
+        gap_rate=args.gap_rate, speed=args.speed, seed=args.seed
+    )
+    for name, value in results.items():
+        print(f"{name:>20}: {value}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,77 @@
+"""
+Compares the flat, time-series and bucketed MongoDB layouts on a local mongod.
+
+Run from the Bot directory:
+    python benchmarks/storage_benchmark.py --uri mongodb://localhost:27017 --candles 20000
+
+Writes synthetic 4h candles in small batches (as the scheduled runs do), then measures
+reads of the last 450 candles, a server-side 1d rollup and the on-disk size of each layout.
+The benchmark uses its own database, which is dropped before each layout is measured.
+"""
+import argparse
+import pandas as pd
+from pymongo import MongoClient
+from benchmark_utils import synthetic_candles, seed_documents, timed
+
+from handlers.mongodb_handler import MongoDBHandler
+
+BENCHMARK_DB = 'OHCLV_benchmark'
+
+
+class QuietLogger:
+    """Logger stand-in so benchmark writes don't fill the bot's log file"""
+    def log_info(self, message):
+        pass
+
+    def log_error(self, message):
+        print(message)
+
+
+def benchmark_layout(uri, storage, documents, batch_size, read_repeat):
+    client = MongoClient(uri)
+    client.drop_database(BENCHMARK_DB)
+    handler = MongoDBHandler(uri, logger=QuietLogger(), storage=storage, database=BENCHMARK_DB)
+
+    def write_all():
+        for i in range(0, len(documents), batch_size):
+            # Copy the documents since insert_many adds an '_id' to them
+            handler.update_collection([dict(document) for document in documents[i:i + batch_size]])
+
+    write_seconds, _ = timed(write_all)
+    read_seconds, last_rows = timed(handler.fetch_last_450_rows, read_repeat)
+    rollup_seconds, daily = timed(lambda: handler.rollup('1d'), read_repeat)
+
+    stats = handler.db.command('collStats', handler.collection.name)
+    results = {
+        'storage': storage,
+        'writes/s': round(len(documents) / write_seconds),
+        'read 450 (ms)': round(read_seconds * 1000, 2),
+        'rollup 1d (ms)': round(rollup_seconds * 1000, 2),
+        'storage (KB)': round(stats.get('storageSize', 0) / 1024),
+        'indexes (KB)': round(stats.get('totalIndexSize', 0) / 1024),
+        'rows read': len(last_rows),
+        'daily bars': len(daily),
+    }
+
+    client.drop_database(BENCHMARK_DB)
+    return results
+
+
+def run_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark MongoDB storage layouts")
+    parser.add_argument('--uri', default='mongodb://localhost:27017', help="MongoDB connection string")
+    parser.add_argument('--candles', type=int, default=20000, help="Number of synthetic 4h candles")
+    parser.add_argument('--batch-size', type=int, default=6, help="Candles written per insert")
+    parser.add_argument('--read-repeat', type=int, default=20, help="Repetitions for read timings")
+    args = parser.parse_args()
+
+    documents = seed_documents(synthetic_candles(args.candles))
+    results = [
+        benchmark_layout(args.uri, storage, documents, args.batch_size, args.read_repeat)
+        for storage in MongoDBHandler.STORAGE_BACKENDS
+    ]
+    print(pd.DataFrame(results).set_index('storage').to_string())
+
+
+if __name__ == "__main__":
+    run_benchmark()
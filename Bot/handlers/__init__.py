@@ -2,5 +2,6 @@ from .mongodb_handler import MongoDBHandler
 from .data_fetcher import DataFetcher
 from .logging_handler import CustomLoggerHandler
 from .telegram_handler import TelegramHandler
+from .status_snapshot import StatusSnapshot, status_snapshot
 
-__all__ = ['MongoDBHandler', 'DataFetcher', 'CustomLoggerHandler', 'TelegramHandler']
\ No newline at end of file
+__all__ = ['MongoDBHandler', 'DataFetcher', 'CustomLoggerHandler', 'TelegramHandler', 'StatusSnapshot', 'status_snapshot']
\ No newline at end of file
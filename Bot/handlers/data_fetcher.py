@@ -5,18 +5,30 @@ import time
 
 class DataFetcher:
     @staticmethod
-    def fetch_new_data(last_timestamp):
+    def fetch_new_data(last_timestamp, exchange=None, clock=None):
+        """
+        Fetch closed 4h candles newer than last_timestamp
+
+        Args:
+            last_timestamp (datetime): Timestamp of the last stored candle
+            exchange (optional): ccxt-compatible exchange, defaults to Bybit futures
+            clock (optional): Object with now() and sleep(seconds), used by the replay
+                              harness to run on an accelerated clock
+        """
         symbol = 'BTC/USDT:USDT'
         timeframe = '4h'
-        exchange = ccxt.bybit({
-            'enableRateLimit': True,
-            'options': {'defaultType': 'future'}
-        })
+        if exchange is None:
+            exchange = ccxt.bybit({
+                'enableRateLimit': True,
+                'options': {'defaultType': 'future'}
+            })
+        now_func = clock.now if clock else (lambda: datetime.datetime.now(datetime.timezone.utc))
+        sleep = clock.sleep if clock else time.sleep
         
         last_timestamp = pd.to_datetime(last_timestamp).tz_localize('UTC') if last_timestamp.tzinfo is None else last_timestamp
         since = int(last_timestamp.timestamp() * 1000)
         
-        now = datetime.datetime.now(datetime.timezone.utc)
+        now = now_func()
         current_candle_start = now.replace(hour=now.hour - now.hour % 4, minute=0, second=0, microsecond=0)
         end_time = int(current_candle_start.timestamp() * 1000)
         
@@ -31,10 +43,10 @@ class DataFetcher:
             
             except ccxt.NetworkError as e:
                 print(f"Network error fetching data: {e}. Retrying in 30 seconds...")
-                time.sleep(30)
+                sleep(30)
             except ccxt.ExchangeError as e:
                 print(f"Exchange error fetching data: {e}. Retrying in 30 seconds...")
-                time.sleep(30)
+                sleep(30)
             except Exception as e:
                 print(f"Unexpected error fetching data: {e}. Skipping this batch.")
                 since += 4 * 60 * 60 * 1000
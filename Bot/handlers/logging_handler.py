@@ -4,6 +4,7 @@ import pytz
 from datetime import datetime
 import telebot
 from config import BOT_TOKEN, CHAT_ID, TIMEZONE
+from handlers.status_snapshot import status_snapshot
 
 
 # Define a custom log level (importance greater than Warning(30) and less than Errors(40)) for ALERTS
@@ -127,6 +128,7 @@ class CustomLoggerHandler:
         """
         # Log to file with IST timestamp
         self.file_logger.alerts(f"Entry Analysis: {message}")
+        status_snapshot.record_event(message)
 
         # Send to Telegram if bot is configured
         if self.bot and self.chat_id:
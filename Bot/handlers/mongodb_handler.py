@@ -1,34 +1,191 @@
 import pandas as pd
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from handlers.logging_handler import CustomLoggerHandler
 
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+OHLCV_FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
 class MongoDBHandler:
-    def __init__(self, connection_string, logger=None):
+    """
+    Stores candles and indicators in one of three layouts:
+
+    - 'flat': one document per candle with a string timestamp (original 'BTC' collection)
+    - 'timeseries': a MongoDB time-series collection with symbol/timeframe as metadata
+    - 'bucketed': N candles per document, grouped by symbol/timeframe and time window
+    """
+    STORAGE_BACKENDS = ('flat', 'timeseries', 'bucketed')
+    COLLECTIONS = {'flat': 'BTC', 'timeseries': 'BTC_timeseries', 'bucketed': 'BTC_buckets'}
+    BUCKET_SIZE = 100
+
+    # $dateTrunc unit and bin size for each rollup timeframe
+    ROLLUP_UNITS = {
+        '8h': ('hour', 8),
+        '12h': ('hour', 12),
+        '1d': ('day', 1),
+        '1w': ('week', 1),
+    }
+
+    def __init__(self, connection_string, logger=None, storage='flat', symbol='BTC/USDT:USDT',
+                 timeframe='4h', database='OHCLV_indicators'):
+        if storage not in self.STORAGE_BACKENDS:
+            raise ValueError(f"Unknown storage backend: {storage}")
+
         self.client = MongoClient(connection_string)
-        self.db = self.client['OHCLV_indicators']
+        self.db = self.client[database]
         self.btc_collection = self.db['BTC']
+        self.storage = storage
+        self.meta = {'symbol': symbol, 'timeframe': timeframe}
+        self.period_ms = int(pd.Timedelta(timeframe).total_seconds() * 1000)
 
         # If no logger is provided, create a default one
         self.logger = logger if logger else CustomLoggerHandler()
 
+        self.collection = self._setup_collection(storage)
+
+    def _setup_collection(self, storage):
+        name = self.COLLECTIONS[storage]
+
+        if storage == 'flat':
+            collection = self.db[name]
+            collection.create_index([('timestamp', -1)])
+        elif storage == 'timeseries':
+            if name not in self.db.list_collection_names():
+                self.db.create_collection(
+                    name,
+                    timeseries={'timeField': 'timestamp', 'metaField': 'meta', 'granularity': 'hours'}
+                )
+            collection = self.db[name]
+            collection.create_index([('meta.symbol', 1), ('meta.timeframe', 1), ('timestamp', -1)])
+        else:
+            collection = self.db[name]
+            collection.create_index([('meta.symbol', 1), ('meta.timeframe', 1), ('start', -1)], unique=True)
+
+        return collection
+
+    def _meta_filter(self):
+        return {'meta.symbol': self.meta['symbol'], 'meta.timeframe': self.meta['timeframe']}
+
+    def _bucket_start(self, timestamp):
+        bucket_ms = self.BUCKET_SIZE * self.period_ms
+        # pandas treats naive timestamps as UTC, unlike datetime.timestamp() which uses host time
+        epoch_ms = pd.Timestamp(timestamp).value // 10**6
+        return pd.Timestamp(epoch_ms - epoch_ms % bucket_ms, unit='ms').to_pydatetime()
+
+    @staticmethod
+    def _to_datetime(timestamp):
+        timestamp = pd.Timestamp(timestamp)
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+        return timestamp.to_pydatetime()
+
+    def _candle_document(self, document):
+        candle = {key: value for key, value in document.items() if key != '_id'}
+        candle['timestamp'] = self._to_datetime(candle['timestamp'])
+        return candle
+
+    def _to_frame(self, rows):
+        df = pd.DataFrame(list(rows))
+        if df.empty:
+            return df
+
+        # Keep the flat layout's string timestamps so callers are layout agnostic
+        if self.storage != 'flat':
+            df['timestamp'] = pd.to_datetime(df['timestamp']).dt.strftime(TIMESTAMP_FORMAT)
+            df = df.drop(columns=['meta'], errors='ignore')
+
+        return df.sort_values('timestamp', ascending=True).reset_index(drop=True)
+
     def get_last_processed_timestamp(self):
-        last_document = self.btc_collection.find_one(sort=[('timestamp', -1)])
-        return last_document['timestamp'] if last_document else None
+        if self.storage == 'flat':
+            last_document = self.collection.find_one(sort=[('timestamp', -1)])
+            return last_document['timestamp'] if last_document else None
+
+        if self.storage == 'timeseries':
+            last_document = self.collection.find_one(self._meta_filter(), sort=[('timestamp', -1)])
+            last_timestamp = last_document['timestamp'] if last_document else None
+        else:
+            last_bucket = self.collection.find_one(self._meta_filter(), sort=[('start', -1)])
+            last_timestamp = last_bucket['end'] if last_bucket else None
+
+        return last_timestamp.strftime(TIMESTAMP_FORMAT) if last_timestamp else None
+
+    def _fetch_last_rows(self, limit, projection=None):
+        if self.storage == 'flat':
+            rows = self.collection.find({}, projection).sort('timestamp', -1).limit(limit)
+        elif self.storage == 'timeseries':
+            rows = self.collection.find(self._meta_filter(), projection).sort('timestamp', -1).limit(limit)
+        else:
+            pipeline = [
+                {'$match': self._meta_filter()},
+                # Buckets can be short after exchange gaps or a partial migration, so keep
+                # taking the newest buckets until their candle counts add up to the limit
+                {'$setWindowFields': {
+                    'sortBy': {'start': -1},
+                    'output': {'running_count': {'$sum': '$count', 'window': {'documents': ['unbounded', 'current']}}},
+                }},
+                {'$match': {'$expr': {'$lt': [{'$subtract': ['$running_count', '$count']}, limit]}}},
+                {'$unwind': '$candles'},
+                {'$replaceRoot': {'newRoot': '$candles'}},
+                {'$sort': {'timestamp': -1}},
+                {'$limit': limit},
+            ]
+            if projection:
+                pipeline.append({'$project': projection})
+            rows = self.collection.aggregate(pipeline)
+
+        return self._to_frame(rows)
 
     def fetch_last_450_rows(self):
-        last_450_rows = self.btc_collection.find().sort('timestamp', -1).limit(450)
-        df = pd.DataFrame(list(last_450_rows))
-        df = df.sort_values('timestamp', ascending=True).reset_index(drop=True)
-        return df
+        return self._fetch_last_rows(450)
+
+    def fetch_ohlcv_history(self, limit):
+        projection = {'_id': 0, 'timestamp': 1}
+        projection.update({field: 1 for field in OHLCV_FIELDS})
+        return self._fetch_last_rows(limit, projection)
+
+    def _write_documents(self, documents):
+        if self.storage == 'flat':
+            self.collection.insert_many(documents)
+            return
+
+        candles = [self._candle_document(document) for document in documents]
+
+        if self.storage == 'timeseries':
+            for candle in candles:
+                candle['meta'] = dict(self.meta)
+            self.collection.insert_many(candles)
+            return
+
+        buckets = {}
+        for candle in candles:
+            buckets.setdefault(self._bucket_start(candle['timestamp']), []).append(candle)
+
+        operations = []
+        for start in sorted(buckets):
+            bucket_candles = buckets[start]
+            timestamps = [candle['timestamp'] for candle in bucket_candles]
+            operations.append(UpdateOne(
+                {'meta': dict(self.meta), 'start': start},
+                {
+                    '$push': {'candles': {'$each': bucket_candles, '$sort': {'timestamp': 1}}},
+                    '$min': {'first': min(timestamps)},
+                    '$max': {'end': max(timestamps)},
+                    '$inc': {'count': len(bucket_candles)},
+                },
+                upsert=True
+            ))
+        # Ordered, so a failure stops at the first bad bucket and migrate_from_flat
+        # resumes from the last bucket that was actually written
+        self.collection.bulk_write(operations, ordered=True)
 
     def update_collection(self, mongo_data):
         new_documents = []
         for document in mongo_data:
             new_documents.append(document)
-        
+
         if new_documents:
             try:
-                self.btc_collection.insert_many(new_documents)
+                self._write_documents(new_documents)
                 # Log to file only, not to Telegram
                 self.logger.log_info(f"Successfully inserted {len(new_documents)} new documents")
             except Exception as e:
@@ -37,4 +194,126 @@ class MongoDBHandler:
                 self.logger.log_error(error_msg)
         else:
             # Log to file only
-            self.logger.log_info("No new documents to insert")
\ No newline at end of file
+            self.logger.log_info("No new documents to insert")
+
+    def migrate_from_flat(self, batch_size=1000):
+        """
+        Copy documents from the flat 'BTC' collection into this handler's layout.
+        Only candles newer than the last one already migrated are copied, so an
+        interrupted migration can be resumed by running it again.
+
+        Args:
+            batch_size (int): Number of documents written per batch
+
+        Returns:
+            int: Number of documents migrated
+        """
+        if self.storage == 'flat':
+            raise ValueError("Migration target must be 'timeseries' or 'bucketed'")
+
+        query = {}
+        last_timestamp = self.get_last_processed_timestamp()
+        if last_timestamp:
+            query['timestamp'] = {'$gt': last_timestamp}
+
+        migrated = 0
+        batch = []
+        for document in self.btc_collection.find(query, {'_id': 0}).sort('timestamp', 1):
+            batch.append(document)
+            if len(batch) >= batch_size:
+                self._write_documents(batch)
+                migrated += len(batch)
+                batch = []
+
+        if batch:
+            self._write_documents(batch)
+            migrated += len(batch)
+
+        self.logger.log_info(f"Migrated {migrated} documents to the {self.storage} layout")
+        return migrated
+
+    def _candle_source_pipeline(self, start=None, end=None):
+        """
+        Aggregation stages yielding one {timestamp: date, open, high, low, close, volume}
+        document per stored candle in the given time range
+        """
+        if self.storage == 'flat':
+            # Flat timestamps are fixed format strings, so range filters compare as strings
+            time_range = {}
+            if start is not None:
+                time_range['$gte'] = self._to_datetime(start).strftime(TIMESTAMP_FORMAT)
+            if end is not None:
+                time_range['$lt'] = self._to_datetime(end).strftime(TIMESTAMP_FORMAT)
+            pipeline = [{'$match': {'timestamp': time_range}}] if time_range else []
+            pipeline.append({'$project': dict(
+                {'timestamp': {'$dateFromString': {'dateString': '$timestamp', 'timezone': 'UTC'}}},
+                **{field: 1 for field in OHLCV_FIELDS}
+            )})
+            return pipeline
+
+        time_range = {}
+        if start is not None:
+            time_range['$gte'] = self._to_datetime(start)
+        if end is not None:
+            time_range['$lt'] = self._to_datetime(end)
+
+        if self.storage == 'timeseries':
+            match = self._meta_filter()
+            if time_range:
+                match['timestamp'] = time_range
+            return [{'$match': match}]
+
+        bucket_match = self._meta_filter()
+        if start is not None:
+            bucket_match['end'] = {'$gte': time_range['$gte']}
+        if end is not None:
+            bucket_match['first'] = {'$lt': time_range['$lt']}
+        pipeline = [
+            {'$match': bucket_match},
+            {'$unwind': '$candles'},
+            {'$replaceRoot': {'newRoot': '$candles'}},
+        ]
+        if time_range:
+            pipeline.append({'$match': {'timestamp': time_range}})
+        return pipeline
+
+    def rollup(self, timeframe, start=None, end=None):
+        """
+        Aggregate stored candles into a higher timeframe on the server
+
+        Args:
+            timeframe (str): One of '8h', '12h', '1d', '1w'
+            start (str | datetime, optional): Include candles at or after this time (UTC)
+            end (str | datetime, optional): Include candles before this time (UTC)
+
+        Returns:
+            pd.DataFrame: OHLCV bars with the bar open time as a string 'timestamp'
+                          and the number of base candles in 'candles'
+        """
+        if timeframe not in self.ROLLUP_UNITS:
+            raise ValueError(f"Unsupported rollup timeframe: {timeframe}")
+
+        unit, bin_size = self.ROLLUP_UNITS[timeframe]
+        date_trunc = {'date': '$timestamp', 'unit': unit, 'binSize': bin_size}
+        if unit == 'week':
+            date_trunc['startOfWeek'] = 'monday'
+
+        pipeline = self._candle_source_pipeline(start, end) + [
+            {'$sort': {'timestamp': 1}},
+            {'$group': {
+                '_id': {'$dateTrunc': date_trunc},
+                'open': {'$first': '$open'},
+                'high': {'$max': '$high'},
+                'low': {'$min': '$low'},
+                'close': {'$last': '$close'},
+                'volume': {'$sum': '$volume'},
+                'candles': {'$sum': 1},
+            }},
+            {'$sort': {'_id': 1}},
+            {'$project': dict({'_id': 0, 'timestamp': '$_id', 'candles': 1}, **{field: 1 for field in OHLCV_FIELDS})},
+        ]
+
+        df = pd.DataFrame(list(self.collection.aggregate(pipeline, allowDiskUse=True)))
+        if not df.empty:
+            df['timestamp'] = pd.to_datetime(df['timestamp']).dt.strftime(TIMESTAMP_FORMAT)
+        return df
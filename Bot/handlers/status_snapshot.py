@@ -0,0 +1,63 @@
+import threading
+from collections import deque
+from datetime import datetime, timezone
+
+
+class StatusSnapshot:
+    """
+    Latest indicator state published by the analysis run and read by the Telegram
+    /status and /last commands. Each publish swaps in a new snapshot, so readers
+    never see a half-updated state and never touch MongoDB or the exchange.
+    """
+    CANDLE_FIELDS = ['open', 'high', 'low', 'close', 'volume']
+    INDICATOR_FIELDS = [
+        'DEMA', 'EMA_20', 'EMA_50', 'EMA_200', 'SuperTrend', 'Signal',
+        'FBB_upper', 'FBB_lower', 'RSI', 'ATR'
+    ]
+
+    def __init__(self, max_events=20):
+        """
+        Args:
+            max_events (int): Number of recent entry analysis events to keep
+        """
+        self._lock = threading.Lock()
+        self._events = deque(maxlen=max_events)
+        self._snapshot = None
+
+    def record_event(self, message):
+        """
+        Record an entry analysis event, made visible on the next publish.
+        Each run re-checks the last few analysed candles, so repeated alerts are skipped.
+        """
+        with self._lock:
+            if message not in self._events:
+                self._events.append(message)
+
+    def publish(self, row):
+        """
+        Publish the latest analysed candle together with the recent events
+
+        Args:
+            row (pd.Series): Latest candle with OHLCV and indicator columns
+        """
+        snapshot = {
+            'timestamp': str(row['timestamp']),
+            'candle': {field: row[field] for field in self.CANDLE_FIELDS},
+            'indicators': {field: row[field] for field in self.INDICATOR_FIELDS if field in row.index},
+            'published_at': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        with self._lock:
+            snapshot['events'] = tuple(self._events)
+            self._snapshot = snapshot
+
+    def get(self):
+        """
+        Returns:
+            dict | None: The latest published snapshot, None before the first run.
+                         Treat it as read-only.
+        """
+        return self._snapshot
+
+
+# Shared by the analysis run and the Telegram polling thread
+status_snapshot = StatusSnapshot()
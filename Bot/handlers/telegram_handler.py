@@ -1,14 +1,24 @@
 import telebot
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from config import BOT_TOKEN, CHAT_ID
 from handlers.logging_handler import CustomLoggerHandler
+from handlers.status_snapshot import status_snapshot
+
+# Commands run on a bounded pool so a slow command (e.g. /logs upload) doesn't block the others
+COMMAND_WORKERS = 4
+COMMAND_QUEUE_SIZE = 16
 
 class TelegramHandler:
     def __init__(self):
-        self.bot = telebot.TeleBot(BOT_TOKEN)
+        # Handlers are dispatched onto our own pool, so telebot doesn't need its worker threads
+        self.bot = telebot.TeleBot(BOT_TOKEN, threaded=False)
         self.chat_id = CHAT_ID
         self.logger = CustomLoggerHandler(bot_token=BOT_TOKEN, chat_id=CHAT_ID)
+        self._command_pool = ThreadPoolExecutor(max_workers=COMMAND_WORKERS, thread_name_prefix='telegram-command')
+        self._command_slots = threading.BoundedSemaphore(COMMAND_WORKERS + COMMAND_QUEUE_SIZE)
         self._setup_stdout_redirect()
         self._setup_handlers()
 
@@ -45,21 +55,54 @@ class TelegramHandler:
         except Exception as e:
             self.logger.log_error_with_code("E003", f"Error sending message to Telegram: {e}")
 
+    def _dispatch(self, handler):
+        """
+        Wrap a command handler so it runs on the command pool instead of the polling thread.
+        When the pool and its queue are full the command is rejected right away.
+        """
+        def dispatch(message):
+            if not self._command_slots.acquire(blocking=False):
+                self.send_message("Bot is busy, please try again in a moment.")
+                return
+            future = self._command_pool.submit(handler, message)
+            future.add_done_callback(self._command_done)
+        return dispatch
+
+    def _command_done(self, future):
+        self._command_slots.release()
+        error = future.exception()
+        if error:
+            self.logger.log_error_with_code("E007", f"Error handling Telegram command: {error}")
+
+    @staticmethod
+    def _format_value(value):
+        if isinstance(value, str):
+            return value
+        try:
+            return f"{float(value):,.2f}"
+        except (TypeError, ValueError):
+            return str(value)
+
     def _setup_handlers(self):
         @self.bot.message_handler(commands=['start'])
+        @self._dispatch
         def handle_start(message):
             self.send_message("Welcome! Type /help for available commands.")
 
         @self.bot.message_handler(commands=['help'])
+        @self._dispatch
         def handle_help(message):
             commands = (
                 "/about - Details about the bot\n"
+                "/status - Latest candle and indicator values\n"
+                "/last - Most recent alerts\n"
                 "/logs - Fetches the log file\n"
                 "/errorcodes - Returns the list of all the error codes raised due to exceptions, if any"
             )
             self.send_message(commands)
 
         @self.bot.message_handler(commands=['about'])
+        @self._dispatch
         def handle_about(message):
             about_text = (
                 "📊 CrossTrend Bot V1.0\n\n"
@@ -72,6 +115,7 @@ class TelegramHandler:
             self.send_message(about_text)
 
         @self.bot.message_handler(commands=['logs'])
+        @self._dispatch
         def handle_log(message):
             log_file_path = 'D:/TelegramBot/Bot/logs/crosstrend_bot_log.log'
             if os.path.exists(log_file_path):
@@ -81,6 +125,7 @@ class TelegramHandler:
                 self.send_message("Error: Log file not found.")
 
         @self.bot.message_handler(commands=['errorcodes'])
+        @self._dispatch
         def handle_errorcodes(message):
             error_codes = (
                 "E001: 'Insufficient Data' — Triggered when the required data is not enough for calculations or analysis.\n"
@@ -92,3 +137,29 @@ class TelegramHandler:
                 "E007: 'Polling Error' - Error encountered during bot polling"
             )
             self.send_message(error_codes)
+
+        @self.bot.message_handler(commands=['status'])
+        @self._dispatch
+        def handle_status(message):
+            snapshot = status_snapshot.get()
+            if snapshot is None:
+                self.send_message("No analysis has completed yet.")
+                return
+
+            lines = [f"📈 Latest candle (open time): {snapshot['timestamp']} UTC"]
+            lines += [f"{field.capitalize()}: {self._format_value(value)}" for field, value in snapshot['candle'].items()]
+            lines.append("")
+            lines += [f"{field}: {self._format_value(value)}" for field, value in snapshot['indicators'].items()]
+            lines.append("")
+            lines.append(f"Updated at: {snapshot['published_at']} UTC")
+            self.send_message("\n".join(lines))
+
+        @self.bot.message_handler(commands=['last'])
+        @self._dispatch
+        def handle_last(message):
+            snapshot = status_snapshot.get()
+            if snapshot is None or not snapshot['events']:
+                self.send_message("No alerts recorded since the bot started.")
+                return
+
+            self.send_message("🔔 Recent alerts:\n" + "\n".join(snapshot['events']))
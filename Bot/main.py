@@ -1,16 +1,41 @@
 import datetime
 import pandas as pd
+import config
 from config import CONNECTION_STRING, BOT_TOKEN, CHAT_ID
-from handlers import MongoDBHandler, DataFetcher, CustomLoggerHandler
-from processors import DataProcessor, EntryAnalyzer, DataFormatter
-
-def main():
+from handlers import MongoDBHandler, DataFetcher, CustomLoggerHandler, status_snapshot
+from processors import DataProcessor, EntryAnalyzer, DataFormatter, TimeframeResampler, ParallelIndicatorProcessor
+
+# Higher timeframes built locally from the 4h candles for trend confirmation, with the
+# indicator columns attached from each. Only the SuperTrend Direction is used for entry
+# signals, and its 12 bar ATR warmup is met on both timeframes by the seed below.
+HIGHER_TIMEFRAMES = {
+    '1d': ('Direction',),
+    '1w': ('Direction',),
+}
+HTF_SEED_ROWS = 6 * 7 * 52  # 52 weeks of 4h candles loaded from MongoDB on the first run
+
+# Kept at module level so completed bars are reused across scheduled runs
+resampler = TimeframeResampler(HIGHER_TIMEFRAMES)
+
+# Optional process pool for indicator math, keeping it off the scheduler and polling threads
+INDICATOR_WORKERS = getattr(config, 'INDICATOR_WORKERS', 0)
+indicator_processor = ParallelIndicatorProcessor(INDICATOR_WORKERS) if INDICATOR_WORKERS else None
+
+def main(mongo_handler=None, logger=None, exchange=None, clock=None):
+    """
+    Runs one analysis cycle. The optional arguments let the replay harness
+    substitute the storage, logger, exchange and clock.
+    """
     # Initialize logger
-    logger = CustomLoggerHandler(bot_token=BOT_TOKEN, chat_id=CHAT_ID)
+    if logger is None:
+        logger = CustomLoggerHandler(bot_token=BOT_TOKEN, chat_id=CHAT_ID)
 
     try:
         # Initialize MongoDB connection
-        mongo_handler = MongoDBHandler(CONNECTION_STRING, logger=logger)
+        if mongo_handler is None:
+            mongo_handler = MongoDBHandler(
+                CONNECTION_STRING, logger=logger, storage=getattr(config, 'MONGO_STORAGE', 'flat')
+            )
 
         # Get last processed timestamp
         last_timestamp = mongo_handler.get_last_processed_timestamp()
@@ -30,14 +55,14 @@ def main():
             db_df['timestamp'] = pd.to_datetime(db_df['timestamp'])
             db_df['timestamp'] = db_df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
             db_df = db_df.sort_values('timestamp')
-            db_df.drop(columns=['_id'], inplace=True)
+            db_df.drop(columns=['_id'], inplace=True, errors='ignore')
         except Exception as e:
             logger.log_error_with_code("E006", f"Error while processing historical data: {str(e)}")
             raise
 
         # Fetch new data
         try:
-            imported_df = DataFetcher.fetch_new_data(last_timestamp)
+            imported_df = DataFetcher.fetch_new_data(last_timestamp, exchange=exchange, clock=clock)
         except Exception as e:
             logger.log_error_with_code("E004", f"Error while fetching new data: {str(e)}")
             raise
@@ -48,6 +73,15 @@ def main():
         df = pd.concat([db_df, imported_df], ignore_index=True)
         df = df.sort_values('timestamp').reset_index(drop=True)
 
+        # Extend higher timeframe bars, seeding them from the full history on the first run
+        try:
+            if resampler.is_empty():
+                resampler.update(mongo_handler.fetch_ohlcv_history(HTF_SEED_ROWS))
+            resampler.update(df)
+        except Exception as e:
+            logger.log_error_with_code("E006", f"Error while resampling higher timeframes: {str(e)}")
+            raise
+
         # Ensure we have enough historical data for calculations
         if len(df) < 450:
             logger.log_error_with_code("E001", "Insufficient historical data for accurate calculations")
@@ -55,22 +89,21 @@ def main():
 
         # Calculate all indicators ensuring proper historical context
         try:
-            df = DataProcessor.basic_indicators(df)
-            df = DataProcessor.calculate_dema(df)  # Calculate DEMA before SuperTrend
-            df = DataProcessor.add_supertrend(df)
-            df = DataProcessor.add_FBB(df)
+            if indicator_processor:
+                df_filtered = indicator_processor.calculate_indicators({'BTC': (df, last_timestamp)})['BTC']
+            else:
+                df_filtered = DataProcessor.calculate_indicators(df, last_timestamp)
         except Exception as e:
             logger.log_error_with_code("E006", f"Error while calculating indicators: {str(e)}")
             raise
 
-        # Drop any unnecessary columns
-        df = df.drop(columns=['hl2', 'vwma_200', 'std_dev'], errors='ignore')
-        df = df.dropna()
-
-        # Filter data for analysis
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df_filtered = df[df['timestamp'] >= (last_timestamp - datetime.timedelta(hours=12))]
-        df_filtered = df_filtered.reset_index(drop=True)
+        # Attach higher timeframe indicators that had closed by each candle's close
+        try:
+            for timeframe, columns in HIGHER_TIMEFRAMES.items():
+                df_filtered = resampler.align(df_filtered, timeframe, columns)
+        except Exception as e:
+            logger.log_error_with_code("E006", f"Error while calculating higher timeframe indicators: {str(e)}")
+            raise
 
         # Perform entry analysis
         try:
@@ -79,6 +112,9 @@ def main():
             logger.log_error_with_code("E006", f"Error during entry analysis: {str(e)}")
             raise
 
+        # Publish the latest state for the /status and /last commands
+        status_snapshot.publish(df_filtered.iloc[-1])
+
         # Prepare data for MongoDB update
         start_index = df_filtered[df_filtered['timestamp'] == last_timestamp].index[0] + 1
         df = df_filtered.iloc[start_index:].reset_index(drop=True)
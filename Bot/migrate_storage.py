@@ -0,0 +1,23 @@
+import argparse
+from config import CONNECTION_STRING
+from handlers import MongoDBHandler, CustomLoggerHandler
+
+
+def migrate_storage():
+    """
+    Copies the flat 'BTC' collection into the time-series or bucketed layout.
+    Safe to re-run: only candles newer than the last migrated one are copied.
+    """
+    parser = argparse.ArgumentParser(description="Migrate stored candles to a new MongoDB layout")
+    parser.add_argument('storage', choices=['timeseries', 'bucketed'], help="Target storage layout")
+    parser.add_argument('--batch-size', type=int, default=1000, help="Documents written per batch")
+    args = parser.parse_args()
+
+    logger = CustomLoggerHandler()
+    mongo_handler = MongoDBHandler(CONNECTION_STRING, logger=logger, storage=args.storage)
+    migrated = mongo_handler.migrate_from_flat(batch_size=args.batch_size)
+    print(f"Migrated {migrated} documents to '{mongo_handler.collection.name}'")
+
+
+if __name__ == "__main__":
+    migrate_storage()
@@ -1,5 +1,7 @@
 from .data_processor import DataProcessor
 from .entry_analyzer import EntryAnalyzer
 from .data_formatter import DataFormatter
+from .resampler import TimeframeResampler
+from .parallel_processor import ParallelIndicatorProcessor
 
-__all__ = ['DataProcessor', 'EntryAnalyzer', 'DataFormatter']
\ No newline at end of file
+__all__ = ['DataProcessor', 'EntryAnalyzer', 'DataFormatter', 'TimeframeResampler', 'ParallelIndicatorProcessor']
\ No newline at end of file
@@ -1,3 +1,4 @@
+import datetime
 import pandas as pd
 import numpy as np
 import ta
@@ -92,3 +93,23 @@ class DataProcessor:
         
         df = df.drop(columns=['hl2', 'vwma_200', 'std_dev'])
         return df
+
+    @staticmethod
+    def calculate_indicators(df, last_timestamp, lookback_hours=12):
+        """
+        Calculate all indicators over the full window and return only the rows needed
+        for entry analysis: those from lookback_hours before last_timestamp onwards
+        """
+        df = DataProcessor.basic_indicators(df)
+        df = DataProcessor.calculate_dema(df)  # Calculate DEMA before SuperTrend
+        df = DataProcessor.add_supertrend(df)
+        df = DataProcessor.add_FBB(df)
+
+        # Drop any unnecessary columns
+        df = df.drop(columns=['hl2', 'vwma_200', 'std_dev'], errors='ignore')
+        df = df.dropna()
+
+        # Filter data for analysis
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        df_filtered = df[df['timestamp'] >= (last_timestamp - datetime.timedelta(hours=lookback_hours))]
+        return df_filtered.reset_index(drop=True)
@@ -1,7 +1,17 @@
 import datetime
+import pandas as pd
 from handlers import CustomLoggerHandler
 
 class EntryAnalyzer:
+    @staticmethod
+    def higher_timeframe_trend(row):
+        trends = [
+            f"{col.split('_', 1)[1]}: {'Buy' if row[col] == 1 else 'Sell'}"
+            for col in row.index
+            if col.startswith('Direction_') and pd.notna(row[col])
+        ]
+        return f" (HTF trend {', '.join(trends)})" if trends else ""
+
     @staticmethod
     def check_entry(df_filtered, last_timestamp, logger):
         start_index = df_filtered[df_filtered['timestamp'] == last_timestamp].index[0] + 1
@@ -65,7 +75,7 @@ class EntryAnalyzer:
                 current_row['Direction'] == 1 and
                 positive_slope
             ):
-                logger.log_entry_analysis(f"Long entry signal at timestamp: {current_row['timestamp'] + datetime.timedelta(hours=4)} UTC")
+                logger.log_entry_analysis(f"Long entry signal at timestamp: {current_row['timestamp'] + datetime.timedelta(hours=4)} UTC{EntryAnalyzer.higher_timeframe_trend(current_row)}")
 
             elif (
                 death_cross and
@@ -73,4 +83,4 @@ class EntryAnalyzer:
                 current_row['Direction'] == -1 and
                 negative_slope
             ):
-                logger.log_entry_analysis(f"Short entry signal at timestamp: {current_row['timestamp'] + datetime.timedelta(hours=4)} UTC")
+                logger.log_entry_analysis(f"Short entry signal at timestamp: {current_row['timestamp'] + datetime.timedelta(hours=4)} UTC{EntryAnalyzer.higher_timeframe_trend(current_row)}")
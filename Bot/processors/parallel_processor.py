@@ -0,0 +1,110 @@
+import atexit
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context, shared_memory
+from processors.data_processor import DataProcessor
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+
+def _calculate_window(shm_name, rows, last_timestamp):
+    """
+    Worker entry point: read a symbol's candles from shared memory and calculate
+    the indicators. Only the filtered rows are sent back to the parent.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        data = np.ndarray((rows, len(OHLCV_COLUMNS)), dtype=np.float64, buffer=shm.buf)
+        df = pd.DataFrame(data.copy(), columns=OHLCV_COLUMNS)
+    finally:
+        shm.close()
+
+    df['timestamp'] = pd.to_datetime(df['timestamp'].astype('int64'), unit='s')
+    return DataProcessor.calculate_indicators(df, last_timestamp)
+
+
+class ParallelIndicatorProcessor:
+    """
+    Calculates indicators for several symbols in a persistent process pool.
+
+    Each symbol's OHLCV window is written into a reusable shared memory block, so only
+    the block name goes to the workers and only the rows needed for entry analysis and
+    storage come back. This keeps per-run IPC independent of the window size and moves
+    the CPU-bound indicator math off the scheduler and Telegram polling threads.
+    """
+    def __init__(self, workers=None):
+        """
+        Args:
+            workers (int, optional): Number of worker processes, defaults to the CPU count
+        """
+        self.workers = workers
+        self._pool = None
+        self._buffers = {}
+        atexit.register(self.close)
+
+    def _get_pool(self):
+        # Workers are spawned rather than forked since the bot runs polling threads
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context('spawn'))
+        return self._pool
+
+    def _load(self, symbol, df):
+        """
+        Write a symbol's candles into its shared memory block, growing the block if needed
+        """
+        shape = (len(df), len(OHLCV_COLUMNS))
+        size = int(np.prod(shape)) * np.dtype(np.float64).itemsize
+
+        shm = self._buffers.get(symbol)
+        if shm is None or shm.size < size:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            shm = shared_memory.SharedMemory(create=True, size=size)
+            self._buffers[symbol] = shm
+
+        data = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        timestamps = pd.to_datetime(df['timestamp']).to_numpy(dtype='datetime64[s]')
+        data[:, 0] = timestamps.astype(np.int64)
+        data[:, 1:] = df[OHLCV_COLUMNS[1:]].to_numpy(dtype=np.float64)
+        return shm.name
+
+    def calculate_indicators(self, frames):
+        """
+        Calculate indicators for every symbol in parallel
+
+        Args:
+            frames (dict): Symbol -> (candles DataFrame, last processed timestamp)
+
+        Returns:
+            dict: Symbol -> filtered DataFrame, as DataProcessor.calculate_indicators returns
+        """
+        try:
+            return self._submit(frames)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM kill), so replace the pool and retry once
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            return self._submit(frames)
+
+    def _submit(self, frames):
+        pool = self._get_pool()
+        futures = {
+            symbol: pool.submit(_calculate_window, self._load(symbol, df), len(df), last_timestamp)
+            for symbol, (df, last_timestamp) in frames.items()
+        }
+        return {symbol: future.result() for symbol, future in futures.items()}
+
+    def close(self):
+        """
+        Shut down the workers and release the shared memory blocks
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for shm in self._buffers.values():
+            shm.close()
+            shm.unlink()
+        self._buffers = {}
@@ -0,0 +1,153 @@
+import pandas as pd
+from processors.data_processor import DataProcessor
+
+
+class TimeframeResampler:
+    """
+    Builds higher timeframe candles from the stored base candles.
+
+    Completed higher timeframe bars are cached per timeframe and extended
+    incrementally as new base candles arrive, so no extra exchange requests
+    or collections are needed for multi-timeframe analysis.
+    """
+    OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+    AGGREGATIONS = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+
+    # pandas resample rule and bar length for each supported timeframe
+    TIMEFRAMES = {
+        '8h': ('8h', pd.Timedelta(hours=8)),
+        '12h': ('12h', pd.Timedelta(hours=12)),
+        '1d': ('1D', pd.Timedelta(days=1)),
+        '1w': ('W-MON', pd.Timedelta(weeks=1)),
+    }
+
+    def __init__(self, timeframes, base_timeframe='4h'):
+        """
+        Initialize the resampler
+
+        Args:
+            timeframes (list): Higher timeframes to build, e.g. ['1d', '1w']
+            base_timeframe (str): Timeframe of the stored base candles
+        """
+        unknown = [tf for tf in timeframes if tf not in self.TIMEFRAMES]
+        if unknown:
+            raise ValueError(f"Unsupported timeframes: {unknown}")
+
+        self.timeframes = list(timeframes)
+        self.base_delta = pd.Timedelta(base_timeframe)
+        self._bars = {tf: None for tf in self.timeframes}
+        self._indicators = {tf: None for tf in self.timeframes}
+
+    def is_empty(self):
+        return all(bars is None or bars.empty for bars in self._bars.values())
+
+    def update(self, df):
+        """
+        Extend the cached higher timeframe bars with new base candles
+
+        Args:
+            df (pd.DataFrame): Base candles with 'timestamp' and OHLCV columns.
+                               Rows already covered by the cache are ignored.
+        """
+        if df.empty:
+            return
+
+        base = df[['timestamp'] + self.OHLCV_COLUMNS].copy()
+        base['timestamp'] = pd.to_datetime(base['timestamp'])
+        base = base.drop_duplicates('timestamp').set_index('timestamp').sort_index()
+        last_close = base.index[-1] + self.base_delta
+
+        for tf in self.timeframes:
+            rule, period = self.TIMEFRAMES[tf]
+            cached = self._bars[tf]
+
+            if cached is not None and not cached.empty:
+                # Only aggregate base candles after the last completed bar
+                base_slice = base[base.index >= cached.index[-1] + period]
+                first_start = None
+            else:
+                base_slice = base
+                first_start = base.index[0]
+
+            if base_slice.empty:
+                continue
+
+            bars = base_slice.resample(rule, label='left', closed='left').agg(self.AGGREGATIONS)
+            bars = bars.dropna(subset=['open'])
+
+            # Keep only bars that have fully closed, dropping a partial first bar
+            completed = bars[bars.index + period <= last_close]
+            if first_start is not None:
+                completed = completed[completed.index >= first_start]
+
+            if completed.empty:
+                continue
+
+            self._bars[tf] = completed if cached is None else pd.concat([cached, completed])
+            self._indicators[tf] = None
+
+    def get_bars(self, timeframe):
+        """
+        Get the completed OHLCV bars of a timeframe
+
+        Returns:
+            pd.DataFrame: Bars with a 'timestamp' column holding the bar open time
+        """
+        bars = self._bars[timeframe]
+        if bars is None:
+            return pd.DataFrame(columns=['timestamp'] + self.OHLCV_COLUMNS)
+        return bars.rename_axis('timestamp').reset_index()
+
+    def get_indicators(self, timeframe):
+        """
+        Get the completed bars of a timeframe with the DataProcessor indicators.
+        Results are cached until new bars are added.
+
+        Returns:
+            pd.DataFrame: Bars with RSI, ATR, EMA, DEMA, SuperTrend and FBB columns
+        """
+        if self._indicators[timeframe] is None:
+            df = self.get_bars(timeframe)
+            if not df.empty:
+                df = DataProcessor.basic_indicators(df)
+                df = DataProcessor.calculate_dema(df)
+                df = DataProcessor.add_supertrend(df)
+                df = DataProcessor.add_FBB(df)
+            self._indicators[timeframe] = df
+        return self._indicators[timeframe]
+
+    def align(self, df, timeframe, columns=('close', 'DEMA', 'Direction')):
+        """
+        Attach higher timeframe values to the base candles without lookahead.
+        Each base candle gets the last higher timeframe bar that had closed by
+        the time the base candle closed.
+
+        Args:
+            df (pd.DataFrame): Base candles with a datetime 'timestamp' column
+            timeframe (str): Higher timeframe to attach
+            columns (tuple): Indicator columns to attach, suffixed with the timeframe
+
+        Returns:
+            pd.DataFrame: Base candles with the extra '<column>_<timeframe>' columns
+        """
+        _, period = self.TIMEFRAMES[timeframe]
+        htf_df = self.get_indicators(timeframe)
+        renamed = {col: f"{col}_{timeframe}" for col in columns}
+
+        if htf_df.empty:
+            aligned = df.copy()
+            for col in renamed.values():
+                aligned[col] = float('nan')
+            return aligned
+
+        htf_df = htf_df[['timestamp'] + list(columns)].rename(columns=renamed)
+        htf_df['available_at'] = pd.to_datetime(htf_df['timestamp']) + period
+        htf_df = htf_df.drop(columns=['timestamp']).sort_values('available_at')
+
+        base = df.copy()
+        base['closed_at'] = pd.to_datetime(base['timestamp']) + self.base_delta
+        base = base.sort_values('closed_at')
+
+        aligned = pd.merge_asof(base, htf_df, left_on='closed_at', right_on='available_at', direction='backward')
+        aligned = aligned.drop(columns=['closed_at', 'available_at'])
+        return aligned